@@ -4,7 +4,6 @@ Helper script to generate fresh YouTube cookies
 Run this script to extract cookies from your browser and save them to cookies.txt
 """
 
-import subprocess
 import sys
 import os
 
@@ -15,8 +14,8 @@ def generate_cookies():
     
     # Check if yt-dlp is installed
     try:
-        subprocess.run(["yt-dlp", "--version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        import yt_dlp
+    except ImportError:
         print("❌ yt-dlp not found. Please install it first:")
         print("   pip install yt-dlp")
         return False
@@ -57,52 +56,45 @@ def generate_cookies():
     print("⚠️  Make sure you're logged into YouTube in your browser!")
     
     try:
-        # Extract cookies and save to cookies.txt
-        cmd = [
-            "yt-dlp",
-            "--cookies-from-browser", browser,
-            "--cookies", "cookies.txt",
-            "--print", "cookies"
-        ]
+        # Load the cookies from the browser and write them to cookies.txt
+        ydl_opts = {
+            "cookiesfrombrowser": (browser,),
+            "cookiefile": "cookies.txt",
+            "quiet": True
+        }
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            ydl.save_cookies()
+    except Exception as e:
+        print("❌ Failed to extract cookies")
+        print(f"Error: {e}")
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # Check for specific Chrome permission error
+        if "Permission denied" in str(e) and browser == "chrome":
+            print("\n🔧 Chrome Permission Error Detected!")
+            print("This happens when Chrome is running and locks its cookie database.")
+            print("\nSolutions:")
+            print("1. Close ALL Chrome windows completely")
+            print("2. Check Task Manager for remaining Chrome processes")
+            print("3. Try again after closing Chrome")
+            print("4. Or use Firefox/Edge instead")
         
-        if result.returncode == 0:
-            print("✅ Cookies extracted successfully!")
-            print(f"📁 Saved to: {os.path.abspath('cookies.txt')}")
-            
-            # Check the file
-            if os.path.exists("cookies.txt"):
-                with open("cookies.txt", "r") as f:
-                    lines = f.readlines()
-                    cookie_count = len([line for line in lines if line.strip() and not line.startswith('#')])
-                    print(f"🍪 Found {cookie_count} cookies")
-                    
-                    if cookie_count > 0:
-                        print("\n🎉 You can now use your API!")
-                        print("💡 Test with: /transcript/dQw4w9WgXcQ")
-                    else:
-                        print("⚠️  No cookies found. Make sure you're logged into YouTube!")
-            return True
-        else:
-            print("❌ Failed to extract cookies")
-            print(f"Error: {result.stderr}")
-            
-            # Check for specific Chrome permission error
-            if "Permission denied" in result.stderr and browser == "chrome":
-                print("\n🔧 Chrome Permission Error Detected!")
-                print("This happens when Chrome is running and locks its cookie database.")
-                print("\nSolutions:")
-                print("1. Close ALL Chrome windows completely")
-                print("2. Check Task Manager for remaining Chrome processes")
-                print("3. Try again after closing Chrome")
-                print("4. Or use Firefox/Edge instead")
-            
-            return False
-            
-    except Exception as e:
-        print(f"❌ Error: {e}")
         return False
+    
+    print("✅ Cookies extracted successfully!")
+    print(f"📁 Saved to: {os.path.abspath('cookies.txt')}")
+    
+    # Check the file
+    if os.path.exists("cookies.txt"):
+        with open("cookies.txt", "r", buffering=65536) as f:
+            cookie_count = sum(1 for line in f if line.strip() and not line.startswith('#'))
+            print(f"🍪 Found {cookie_count} cookies")
+            
+            if cookie_count > 0:
+                print("\n🎉 You can now use your API!")
+                print("💡 Test with: /transcript/dQw4w9WgXcQ")
+            else:
+                print("⚠️  No cookies found. Make sure you're logged into YouTube!")
+    return True
 
 if __name__ == "__main__":
     success = generate_cookies()
@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import threading
 
@@ -14,6 +15,12 @@ class YouTubeTranscriptGUI:
         # API URL (change this to your ngrok URL when testing)
         self.api_url = "http://127.0.0.1:8000"
         
+        # Reuse one HTTP session so repeated extractions keep the connection alive
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=4)
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -96,7 +103,7 @@ class YouTubeTranscriptGUI:
         try:
             # Make API request
             url = f"{self.api_url}/video-info/{video_id}"
-            response = requests.get(url, timeout=30)
+            response = self.http.get(url, timeout=30)
             
             if response.status_code == 200:
                 data = response.json()
@@ -136,13 +143,12 @@ class YouTubeTranscriptGUI:
         # Display captions with timestamps
         captions = data.get('captions', [])
         if captions:
-            for i, caption in enumerate(captions, 1):
-                start_time = caption.get('start', '00:00')
-                end_time = caption.get('end', '00:00')
-                text = caption.get('text', '')
-                
-                caption_line = f"[{i:3d}] {start_time} - {end_time}: {text}\n\n"
-                self.transcript_text.insert(tk.END, caption_line)
+            # Build all rows first and insert once; per-row inserts reflow the widget each time
+            caption_lines = [
+                f"[{i:3d}] {caption.get('start', '00:00')} - {caption.get('end', '00:00')}: {caption.get('text', '')}\n\n"
+                for i, caption in enumerate(captions, 1)
+            ]
+            self.transcript_text.insert(tk.END, "".join(caption_lines))
             
             self.status_var.set(f"Success! Found {len(captions)} caption segments")
         else:
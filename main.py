@@ -1,20 +1,77 @@
 import yt_dlp
-import json
+from yt_dlp.networking.exceptions import HTTPError as YDLHTTPError
+from yt_dlp.utils import DownloadError, ExtractorError
+import asyncio
+import bisect
+import hashlib
+import html
+import io
+import ijson
+import orjson
+import queue
 import re
 import requests
-from fastapi import FastAPI, HTTPException
+import socket
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional
 import uvicorn
 import os
 import time
 import random
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from cachetools import TTLCache
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+
+# yt-dlp extraction and caption downloads run on a dedicated executor, so a
+# burst of slow YouTube calls cannot starve Starlette's shared threadpool.
+# Requests beyond EXTRACTION_WORKERS queue up here (backpressure).
+EXTRACTION_WORKERS = int(os.environ.get("EXTRACTION_WORKERS", 16))
+
+
+def _extraction_executor() -> ThreadPoolExecutor:
+    """Return the app's extraction executor, creating it on first use.
+
+    Normally lifespan creates it at startup; hosts that never send lifespan
+    events (such as some serverless runtimes) get it lazily instead. Only
+    called from the event loop, so there is no creation race.
+    """
+    executor = getattr(app.state, "extraction_executor", None)
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=EXTRACTION_WORKERS, thread_name_prefix="extract")
+        app.state.extraction_executor = executor
+    return executor
+
+
+async def _run_extraction(func, *args):
+    """Run a blocking extraction function on the dedicated executor."""
+    return await asyncio.get_running_loop().run_in_executor(_extraction_executor(), func, *args)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # A fresh pool per startup, so a restarted app never reuses a shut-down one
+    executor = _extraction_executor()
+    yield
+    del app.state.extraction_executor
+    executor.shutdown(wait=False, cancel_futures=True)
+
 
 app = FastAPI(
     title="YouTube Transcript API",
     description="Extract video info and transcripts from YouTube videos",
-    version="1.0.2"
+    version="1.0.2",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 app.add_middleware(
     CORSMiddleware,
@@ -22,6 +79,175 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Transcripts are large, highly compressible text; level 5 is the usual
+# ratio/CPU sweet spot
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# yt-dlp options shared by every extraction. The extractor is built once at
+# import time and reused; the cookies file (COOKIES_FILE, default
+# cookies.txt) is picked up here if it exists.
+_COOKIES_FILE = os.environ.get("COOKIES_FILE", "cookies.txt")
+_YDL_OPTS = {
+    "writesubtitles": True,
+    "writeautomaticsub": True,
+    "subtitleslangs": ["en"],
+    "skip_download": True,
+    "quiet": True,
+    "no_warnings": True,
+    # Only caption tracks and metadata are used, so skip building the
+    # HLS/DASH format ladders
+    "extractor_args": {"youtube": {"skip": ["hls", "dash"]}},
+    "youtube_include_dash_manifest": False,
+    "youtube_include_hls_manifest": False,
+    # Add user-agent to appear more like a real browser
+    "http_headers": {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-us,en;q=0.5",
+        # brotli is installed (requirements.txt), so yt-dlp can decode br
+        "Accept-Encoding": "gzip, deflate, br",
+        "Accept-Charset": "ISO-8859-1,utf-8;q=0.7,*;q=0.7",
+        "DNT": "1",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+    }
+}
+
+if os.path.exists(_COOKIES_FILE):
+    _YDL_OPTS["cookiefile"] = _COOKIES_FILE
+    print(f"Using cookies file: {_COOKIES_FILE}")
+else:
+    print("No cookies file found, proceeding without authentication")
+
+# Metadata-only options for the "Requested format is not available" fallback
+_SIMPLE_YDL_OPTS = {
+    "skip_download": True,
+    "quiet": True,
+    "no_warnings": True,
+    "http_headers": _YDL_OPTS["http_headers"]
+}
+if "cookiefile" in _YDL_OPTS:
+    _SIMPLE_YDL_OPTS["cookiefile"] = _YDL_OPTS["cookiefile"]
+
+# YoutubeDL is not thread-safe, so each extraction checks an instance out of
+# this pool; up to YDL_POOL_SIZE different videos can be extracted at once,
+# while requests for the same video share one extraction (see _extract_info)
+YDL_POOL_SIZE = int(os.environ.get("YDL_POOL_SIZE", 4))
+_YDL_POOL = queue.Queue()
+for _ in range(YDL_POOL_SIZE):
+    _YDL_POOL.put(yt_dlp.YoutubeDL(_YDL_OPTS))
+
+# Per-video_id extraction locks with a count of threads holding or waiting
+# on each, so an entry is dropped once nobody needs it
+_EXTRACT_LOCKS = {}
+_EXTRACT_LOCKS_GUARD = threading.Lock()
+
+# yt-dlp and requests resolve the same few YouTube hosts on every request, so
+# getaddrinfo answers are kept for five minutes. Failed lookups are not cached.
+_DNS_CACHE = TTLCache(maxsize=256, ttl=300)
+_DNS_CACHE_LOCK = threading.Lock()
+_getaddrinfo = socket.getaddrinfo
+
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    key = (host, port, family, type, proto, flags)
+    with _DNS_CACHE_LOCK:
+        cached = _DNS_CACHE.get(key)
+    if cached is None:
+        cached = _getaddrinfo(host, port, family, type, proto, flags)
+        with _DNS_CACHE_LOCK:
+            _DNS_CACHE[key] = cached
+    return list(cached)
+
+
+socket.getaddrinfo = _cached_getaddrinfo
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets use TCP keepalive.
+
+    urllib3 already disables Nagle (TCP_NODELAY); SO_KEEPALIVE additionally
+    lets the kernel detect connections that went away while idle in the pool.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
+
+# Shared HTTP session so caption downloads reuse keep-alive connections.
+# requests advertises "br" in Accept-Encoding whenever brotli is installed
+# (see requirements.txt) and iter_content() decompresses transparently.
+_SESSION = requests.Session()
+_SESSION.mount("https://", _KeepAliveAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+
+# Direct caption and title lookups used before falling back to yt-dlp
+_TIMEDTEXT_URL = "https://www.youtube.com/api/timedtext?lang=en&v={video_id}&fmt=json3"
+_OEMBED_URL = "https://www.youtube.com/oembed"
+_INNERTUBE_PLAYER_URL = "https://www.youtube.com/youtubei/v1/player"
+_INNERTUBE_CONTEXT = {"client": {"clientName": "ANDROID", "clientVersion": "19.09.37", "hl": "en"}}
+_INNERTUBE_HEADERS = {
+    "Content-Type": "application/json",
+    "User-Agent": "com.google.android.youtube/19.09.37 (Linux; U; Android 11) gzip",
+}
+
+# yt-dlp results keyed by video_id, shared by /transcript and /video-info
+_INFO_CACHE = TTLCache(maxsize=2048, ttl=1800)
+_INFO_CACHE_LOCK = threading.Lock()
+_INFO_FIELDS = ("title", "duration", "view_count", "uploader", "upload_date", "description")
+
+# Caption bodies larger than this are rejected rather than buffered
+_MAX_CAPTION_BYTES = 64 * 1024 * 1024
+
+# json3 bodies at least this large are stream-parsed with ijson instead of
+# being decoded into a full dict tree by orjson
+_IJSON_MIN_BYTES = 4 * 1024 * 1024
+
+# yt-dlp caption bodies with their ETag/Last-Modified validators, keyed by
+# track URL. Bounded by total body bytes; the TTL matches _INFO_CACHE, past
+# which the track URLs are no longer reused anyway. Entries younger than
+# _CAPTION_FRESH_SECONDS are served without revalidating.
+_CAPTION_CACHE = TTLCache(maxsize=256 * 1024 * 1024, ttl=1800, getsizeof=lambda entry: len(entry["body"]))
+_CAPTION_FRESH_SECONDS = 300
+_CAPTION_CACHE_LOCK = threading.Lock()
+
+# Last parse of cookies.txt for /auth-status: "entry" -> ((path, mtime, size), stats)
+_COOKIE_STATS_CACHE = {}
+
+# Successful transcript results keyed by video_id. Failures are never stored
+# so a retry after refreshing cookies goes straight back to YouTube.
+_TRANSCRIPT_CACHE = TTLCache(maxsize=1024, ttl=3600)
+_TRANSCRIPT_CACHE_LOCK = threading.Lock()
+
+# In-flight extractions keyed by (function, video_id), so concurrent requests for the same
+# video share one yt-dlp run instead of each starting their own
+_INFLIGHT = {}
+
+
+# YouTube video IDs: exactly 11 URL-safe base64 characters
+_VIDEO_ID_RE = re.compile(r"[A-Za-z0-9_-]{11}")
+
+# VTT cue timestamp: optional hours, then mm:ss and an optional fraction
+_VTT_TS_RE = re.compile(r"(?:(\d+):)?(\d+):(\d+)(?:\.(\d+))?")
+
+# Inline cue markup such as <c> or <00:00:01.000> in VTT captions
+_TAG_RE = re.compile(r"<[^>]+>")
+# VTT lines that carry no caption text: the WEBVTT header block (with its
+# Kind:/Language: metadata), whole NOTE/STYLE blocks, timings and cue numbers.
+# A block runs until the next blank line, so the input must have \n newlines.
+_CUE_LINE_RE = re.compile(
+    r"\A\ufeff?WEBVTT[^\n]*(?:\n[ \t]*[^\s][^\n]*)*"
+    r"|(?<=\n\n)(?:NOTE|STYLE)(?:[ \t][^\n]*)?(?:\n[ \t]*[^\s][^\n]*)*"
+    r"|^.*-->.*$|^\s*\d+\s*$",
+    re.MULTILINE
+)
+
 
 class VideoResponse(BaseModel):
     video_url: str
@@ -41,61 +267,365 @@ def _format_ms_to_mmss(milliseconds: int) -> str:
 
 def _parse_vtt_time_to_ms(time_str: str) -> int:
     """Parse a VTT timestamp (hh:mm:ss.mmm or mm:ss.mmm) to milliseconds."""
-    # Support both hh:mm:ss.mmm and mm:ss.mmm
-    parts = time_str.split(":")
-    if len(parts) == 3:
-        hours = int(parts[0])
-        minutes = int(parts[1])
-        seconds = float(parts[2])
-    elif len(parts) == 2:
-        hours = 0
-        minutes = int(parts[0])
-        seconds = float(parts[1])
-    else:
+    match = _VTT_TS_RE.match(time_str)
+    if match is None:
         return 0
-    return int(((hours * 60 + minutes) * 60 + seconds) * 1000)
+    hours, minutes, seconds, fraction = match.groups("0")
+    # Integer math throughout; the fraction is padded/cut to milliseconds
+    return ((int(hours) * 60 + int(minutes)) * 60 + int(seconds)) * 1000 + int((fraction + "00")[:3])
 
 
-def _extract_captions_with_timestamps(info: dict) -> dict:
-    """Return captions with timestamps if available.
+def _extract_info(video_id: str) -> dict:
+    """Run yt-dlp for a video, caching the result per video_id.
 
-    Returns dict: { 'captions': [ {start, end, text} ], 'caption_type': 'manual'|'auto'|None }
+    Only the metadata fields the endpoints read are kept, and caption tracks
+    are kept for English only, so cached entries stay small. Extraction
+    errors propagate and are never cached.
+    """
+    with _INFO_CACHE_LOCK:
+        cached = _INFO_CACHE.get(video_id)
+    if cached is not None:
+        return cached
+
+    # One extraction per video at a time: a concurrent caller for the same
+    # id (e.g. /bundle's two lookups) waits here and then hits the cache
+    with _EXTRACT_LOCKS_GUARD:
+        entry = _EXTRACT_LOCKS.setdefault(video_id, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            with _INFO_CACHE_LOCK:
+                cached = _INFO_CACHE.get(video_id)
+            if cached is not None:
+                return cached
+
+            # process=False skips format selection; subtitles and
+            # automatic_captions are already present in the raw info dict
+            ydl = _YDL_POOL.get()
+            try:
+                info = ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False, process=False)
+            finally:
+                _YDL_POOL.put(ydl)
+
+            slim = {field: info[field] for field in _INFO_FIELDS if field in info}
+            for key in ("subtitles", "automatic_captions"):
+                tracks = info.get(key) or {}
+                slim[key] = {lang: (formats if lang == "en" else []) for lang, formats in tracks.items()}
+
+            with _INFO_CACHE_LOCK:
+                _INFO_CACHE[video_id] = slim
+            return slim
+    finally:
+        with _EXTRACT_LOCKS_GUARD:
+            entry[1] -= 1
+            if not entry[1]:
+                del _EXTRACT_LOCKS[video_id]
+
+
+def _transcript_result(video_url: str, video_name: str, transcript: str, success: bool, message: str) -> dict:
+    """Build a /transcript result dict (the VideoResponse fields)."""
+    return {
+        "video_url": video_url,
+        "video_name": video_name,
+        "transcript": transcript,
+        "success": success,
+        "message": message
+    }
+
+
+# Seconds clients are told to wait after YouTube answers 429
+_RATE_LIMIT_RETRY_AFTER = 60
+
+
+def _rate_limited_error() -> HTTPException:
+    """429 for clients when YouTube is throttling us, so they back off"""
+    return HTTPException(
+        status_code=429,
+        detail="YouTube is rate limiting requests. Please retry later.",
+        headers={"Retry-After": str(_RATE_LIMIT_RETRY_AFTER)}
+    )
+
+
+def _is_rate_limited(error: BaseException) -> bool:
+    """Whether a yt-dlp error was caused by an HTTP 429 from YouTube"""
+    # DownloadError wraps the ExtractorError, which wraps the HTTPError
+    while error is not None:
+        if isinstance(error, YDLHTTPError):
+            return error.status == 429
+        if isinstance(error, DownloadError):
+            error = error.exc_info[1] if error.exc_info else None
+        elif isinstance(error, ExtractorError):
+            error = error.cause
+        else:
+            error = error.__cause__
+    return False
+
+
+def _read_body(resp) -> bytearray:
+    """Read a streamed response body into one bytearray.
+
+    An uncompressed body with a Content-Length is read straight into a buffer
+    of that size, capped at _MAX_CAPTION_BYTES. Compressed bodies are decoded
+    on the fly, so their length is unknown; they, and bodies with a missing
+    or malformed header, grow the buffer as chunks arrive instead.
+
+    Raises ValueError once the body exceeds _MAX_CAPTION_BYTES.
+    """
+    size = resp.headers.get("Content-Length", "").strip()
+    expected = 0
+    if size.isdigit() and not resp.headers.get("Content-Encoding"):
+        expected = min(int(size), _MAX_CAPTION_BYTES)
+
+    buf = bytearray(expected)
+    offset = 0
+    overflow = b""
+    chunks = resp.iter_content(65536)
+    if expected:
+        with memoryview(buf) as view:
+            for chunk in chunks:
+                end = offset + len(chunk)
+                if end > expected:
+                    overflow = chunk
+                    break
+                view[offset:end] = chunk
+                offset = end
+    # Trim a short body, then append whatever goes past the preallocated part
+    del buf[offset:]
+    for chunk in chain((overflow,), chunks):
+        buf.extend(chunk)
+        if len(buf) > _MAX_CAPTION_BYTES:
+            raise ValueError(f"Caption body exceeds {_MAX_CAPTION_BYTES} bytes")
+    return buf
+
+
+def _download_caption(url: str, timeout=(3, 10), cache: bool = True):
+    """Stream a caption track into a single buffer.
+
+    With cache=True, downloaded bodies are remembered per URL. Within _CAPTION_FRESH_SECONDS
+    the stored body is returned without any request; after that, bodies that
+    came with an ETag or Last-Modified header are revalidated with a
+    conditional request, and a 304 reuses the stored body.
+
+    Returns (status_code, body) where body is a bytearray (empty on non-200).
+    Cached bodies are shared between callers and must not be modified.
+    """
+    cached = None
+    if cache:
+        with _CAPTION_CACHE_LOCK:
+            cached = _CAPTION_CACHE.get(url)
+    headers = {}
+    if cached is not None:
+        if time.monotonic() - cached["fetched"] < _CAPTION_FRESH_SECONDS:
+            return 200, cached["body"]
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    with _SESSION.get(url, headers=headers, timeout=timeout, stream=True) as resp:
+        if resp.status_code == 304 and cached is not None:
+            with _CAPTION_CACHE_LOCK:
+                _CAPTION_CACHE[url] = dict(cached, fetched=time.monotonic())
+            return 200, cached["body"]
+        if resp.status_code != 200:
+            return resp.status_code, bytearray()
+        buf = _read_body(resp)
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+
+    if cache:
+        with _CAPTION_CACHE_LOCK:
+            _CAPTION_CACHE[url] = {
+                "etag": etag, "last_modified": last_modified, "body": buf, "fetched": time.monotonic()
+            }
+    return 200, buf
+
+
+def _json3_to_transcript(data: dict) -> str:
+    """Join the text of every json3 caption event into one string."""
+    # Flatten events -> segs in C rather than a nested Python loop
+    segs = chain.from_iterable(event.get("segs", ()) for event in data.get("events", ()))
+    texts = " ".join(seg.get("utf8", "") for seg in segs)
+
+    # Normalize whitespace once over the whole transcript
+    return " ".join(texts.split())
+
+
+def _json3_body_to_transcript(body) -> Optional[str]:
+    """Parse a raw json3 caption body into transcript text.
+
+    Bodies over _IJSON_MIN_BYTES are stream-parsed with ijson, pulling out
+    only the segment text instead of building the whole event tree.
+    Returns None if the body is empty or not valid JSON.
+    """
+    try:
+        if len(body) >= _IJSON_MIN_BYTES:
+            texts = ijson.items(io.BytesIO(body), "events.item.segs.item.utf8")
+            return " ".join(" ".join(filter(None, texts)).split())
+        data = orjson.loads(body)
+    except (orjson.JSONDecodeError, ijson.JSONError):
+        return None
+    if not data:
+        return None
+    return _json3_to_transcript(data)
+
+
+def _fetch_oembed_title(video_url: str) -> str:
+    """Look up a video title via oEmbed, which is far cheaper than yt-dlp."""
+    try:
+        resp = _SESSION.get(_OEMBED_URL, params={"url": video_url, "format": "json"}, timeout=(3, 5))
+        if resp.status_code == 200:
+            return orjson.loads(resp.content).get("title", "Unknown Title")
+    except Exception:
+        pass
+    return "Unknown Title"
+
+
+def _fetch_transcript_fast(video_id: str, video_url: str):
+    """Try YouTube's timedtext endpoint directly, without running yt-dlp.
+
+    Returns a transcript result dict, or None if no English captions came back
+    (the caller then falls back to the full yt-dlp extraction).
+    """
+    try:
+        # Not kept in _CAPTION_CACHE: the parsed result lands in _TRANSCRIPT_CACHE
+        status_code, body = _download_caption(_TIMEDTEXT_URL.format(video_id=video_id), timeout=(3, 5), cache=False)
+        if status_code != 200 or not body:
+            return None
+        transcript = _json3_body_to_transcript(body)
+    except Exception:
+        return None
+    if not transcript:
+        return None
+
+    return _transcript_result(
+        video_url, _fetch_oembed_title(video_url), transcript, True,
+        "Transcript extracted successfully (manual captions)"
+    )
+
+
+def _fetch_transcript_innertube(video_id: str, video_url: str):
+    """Look up caption tracks via YouTube's InnerTube player API.
+
+    One POST returns the title and every caption track (manual and auto), so
+    this covers auto-captioned videos that the timedtext lookup misses. Returns
+    a transcript result dict, or None so the caller can fall back to yt-dlp.
+    """
+    try:
+        resp = _SESSION.post(
+            _INNERTUBE_PLAYER_URL,
+            data=orjson.dumps({"context": _INNERTUBE_CONTEXT, "videoId": video_id}),
+            headers=_INNERTUBE_HEADERS,
+            timeout=(3, 5)
+        )
+        if resp.status_code != 200:
+            return None
+        player = orjson.loads(resp.content)
+        tracks = (player.get("captions") or {}).get("playerCaptionsTracklistRenderer", {}).get("captionTracks", [])
+        english = [t for t in tracks if t.get("languageCode") == "en" and t.get("baseUrl")]
+        if not english:
+            return None
+
+        # Prefer manual captions over auto-generated (kind == "asr") ones
+        chosen = next((t for t in english if t.get("kind") != "asr"), english[0])
+        caption_type = "auto" if chosen.get("kind") == "asr" else "manual"
+
+        status_code, body = _download_caption(chosen["baseUrl"] + "&fmt=json3", timeout=(3, 5), cache=False)
+        if status_code != 200 or not body:
+            return None
+        transcript = _json3_body_to_transcript(body)
+    except Exception:
+        return None
+    if not transcript:
+        return None
+
+    title = (player.get("videoDetails") or {}).get("title", "Unknown Title")
+    return _transcript_result(
+        video_url, title, transcript, True,
+        f"Transcript extracted successfully ({caption_type} captions)"
+    )
+
+
+def _download_english_captions(info: dict):
+    """Pick the English caption track from a yt-dlp info dict and download it.
+
+    Manual subtitles win over automatic captions. json3 is preferred, then
+    VTT if the json3 download fails; srv3/TTML are XML and are only used when
+    neither is listed.
+    Both /transcript and /video-info go through here, so the same track URL
+    is chosen and _CAPTION_CACHE serves the second request.
+
+    Returns (caption_type, ext, status_code, body). caption_type is None when
+    there are no English captions and ext is None when the English entry has
+    no tracks; nothing is downloaded in either case.
     """
     subtitles = info.get("subtitles", {})
     auto_subs = info.get("automatic_captions", {})
-    caption_tracks = None
-    caption_type = None
-
     if "en" in subtitles:
-        caption_tracks = subtitles["en"]
-        caption_type = "manual"
+        caption_tracks, caption_type = subtitles["en"], "manual"
     elif "en" in auto_subs:
-        caption_tracks = auto_subs["en"]
-        caption_type = "auto"
-
+        caption_tracks, caption_type = auto_subs["en"], "auto"
+    else:
+        return None, None, 0, bytearray()
     if not caption_tracks:
-        return {"captions": [], "caption_type": None}
+        return caption_type, None, 0, bytearray()
+
+    # Built from the reversed list so the first track of each ext wins
+    by_ext = {c.get("ext"): c for c in reversed(caption_tracks)}
+    candidates = [by_ext[ext] for ext in ("json3", "vtt") if ext in by_ext] or [caption_tracks[0]]
+    # If the preferred format fails (bad status, network error or an oversized
+    # body), try the next one rather than giving up; a 429 would hit every
+    # format alike, so it ends the loop
+    result, error = None, None
+    for chosen in candidates:
+        try:
+            status_code, body = _download_caption(chosen["url"])
+        except (requests.RequestException, ValueError) as e:
+            error = e
+            continue
+        result = (caption_type, chosen.get("ext") or "", status_code, body)
+        if status_code in (200, 429):
+            break
+    if result is None:
+        raise error
+    return result
 
-    # Prefer JSON-based tracks (json3/srv3), then fall back to VTT/TTML
-    chosen = next((c for c in caption_tracks if c.get("ext") in ("json3", "srv3")), None)
-    if not chosen:
-        chosen = next((c for c in caption_tracks if c.get("ext") in ("vtt", "ttml", "xml")), caption_tracks[0])
 
+def _extract_captions_with_timestamps(info: dict) -> dict:
+    """Return captions with timestamps if available.
+
+    Returns dict: { 'captions': [ {start, end, text} ], 'caption_type': 'manual'|'auto'|None }
+    """
+    # Bound before the try so a failed download still reaches the fallback return
+    caption_type = None
     try:
-        resp = requests.get(chosen["url"])  # type: ignore[index]
-        if resp.status_code != 200:
+        caption_type, ext, status_code, body = _download_english_captions(info)
+        if ext is None:
+            return {"captions": [], "caption_type": None}
+        if status_code == 429:
+            raise _rate_limited_error()
+        if status_code != 200:
             return {"captions": [], "caption_type": caption_type}
         # JSON captions
-        if chosen.get("ext") in ("json3", "srv3"):
-            try:
-                data = resp.json()
-            except Exception:
-                data = None
-            if not data:
-                return {"captions": [], "caption_type": caption_type}
+        if ext == "json3":
+            if len(body) >= _IJSON_MIN_BYTES:
+                # Stream events one at a time instead of decoding the whole tree;
+                # a malformed body raises during iteration and is caught below
+                events = ijson.items(io.BytesIO(body), "events.item", use_float=True)
+            else:
+                try:
+                    data = orjson.loads(body)
+                except orjson.JSONDecodeError:
+                    data = None
+                if not data:
+                    return {"captions": [], "caption_type": caption_type}
+                events = data.get("events", [])
 
             results = []
-            for event in data.get("events", []):
+            # Bound locally: this loop runs once per caption event
+            append = results.append
+            fmt = _format_ms_to_mmss
+            for event in events:
                 start_ms = event.get("tStartMs")
                 duration_ms = event.get("dDurationMs")
                 if start_ms is None:
@@ -104,245 +634,185 @@ def _extract_captions_with_timestamps(info: dict) -> dict:
                     duration_ms = 0
                 end_ms = start_ms + duration_ms
                 segments = event.get("segs", []) or []
-                text_parts = []
-                for seg in segments:
-                    piece = (seg.get("utf8") or "").replace("\n", " ").strip()
-                    if piece:
-                        text_parts.append(piece)
-                text = " ".join(text_parts).strip()
+                # split() collapses newlines and runs of spaces in one C pass
+                text = " ".join(" ".join(seg.get("utf8") or "" for seg in segments).split())
                 if not text:
                     continue
-                results.append({
-                    "start": _format_ms_to_mmss(int(start_ms)),
-                    "end": _format_ms_to_mmss(int(end_ms)),
+                append({
+                    "start": fmt(int(start_ms)),
+                    "end": fmt(int(end_ms)),
                     "text": text
                 })
             return {"captions": results, "caption_type": caption_type}
 
         # VTT/TTML fallback (best-effort parsing)
-        text = resp.text
-        lines = text.splitlines()
+        lines = io.StringIO(body.decode("utf-8", errors="replace"))
         results = []
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            if "-->" in line:
-                # Example: 00:00:01.000 --> 00:00:03.000
-                try:
-                    parts = [p.strip() for p in line.split("-->")]
-                    start_ms = _parse_vtt_time_to_ms(parts[0])
-                    end_ms = _parse_vtt_time_to_ms(parts[1].split(" ")[0])
-                    i += 1
-                    text_lines = []
-                    while i < len(lines) and lines[i].strip() != "":
-                        payload = re.sub(r"<[^>]+>", "", lines[i]).strip()
-                        if payload and not payload.isdigit():
-                            text_lines.append(payload)
-                        i += 1
-                    text_joined = " ".join(text_lines).strip()
-                    if text_joined:
-                        results.append({
-                            "start": _format_ms_to_mmss(int(start_ms)),
-                            "end": _format_ms_to_mmss(int(end_ms)),
-                            "text": text_joined
-                        })
-                except Exception:
-                    pass
-            else:
-                i += 1
+        for line in lines:
+            line = line.strip()
+            if "-->" not in line:
+                continue
+            # Example: 00:00:01.000 --> 00:00:03.000
+            try:
+                parts = [p.strip() for p in line.split("-->")]
+                start_ms = _parse_vtt_time_to_ms(parts[0])
+                end_ms = _parse_vtt_time_to_ms(parts[1].split(" ")[0])
+                text_lines = []
+                for cue_line in lines:
+                    # Strip once; the blank line that ends the cue is falsy
+                    payload = cue_line.strip()
+                    if not payload:
+                        break
+                    if payload.isdigit():
+                        continue
+                    # Most cue lines carry no markup or entities; skip the
+                    # regex and unescape for those
+                    if "<" in payload:
+                        payload = _TAG_RE.sub("", payload)
+                    if "&" in payload:
+                        payload = html.unescape(payload)
+                    text_lines.append(payload)
+                text_joined = " ".join(" ".join(text_lines).split())
+                if text_joined:
+                    results.append({
+                        "start": _format_ms_to_mmss(int(start_ms)),
+                        "end": _format_ms_to_mmss(int(end_ms)),
+                        "text": text_joined
+                    })
+            except Exception:
+                pass
         return {"captions": results, "caption_type": caption_type}
+    except HTTPException:
+        raise
     except Exception:
         return {"captions": [], "caption_type": caption_type}
 
 
 def get_video_info_and_transcript(video_id: str):
+    """Extract video info + English transcript, served from cache when possible"""
+    with _TRANSCRIPT_CACHE_LOCK:
+        cached = _TRANSCRIPT_CACHE.get(video_id)
+    if cached is not None:
+        return dict(cached)
+
+    result = _fetch_video_info_and_transcript(video_id)
+    if result["success"]:
+        with _TRANSCRIPT_CACHE_LOCK:
+            _TRANSCRIPT_CACHE[video_id] = dict(result)
+    return result
+
+
+def _fetch_video_info_and_transcript(video_id: str):
     """Extract video info + English transcript if available"""
 
-    # Always try to load cookies.txt (if it exists in project root)
-    cookies_file = "cookies.txt"
-    ydl_opts = {
-        "writesubtitles": True,
-        "writeautomaticsub": True,
-        "subtitleslangs": ["en"],
-        "skip_download": True,
-        "quiet": True,
-        "no_warnings": True,
-        # Add user-agent to appear more like a real browser
-        "http_headers": {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-us,en;q=0.5",
-            "Accept-Encoding": "gzip,deflate",
-            "Accept-Charset": "ISO-8859-1,utf-8;q=0.7,*;q=0.7",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        }
-    }
-    
-    if os.path.exists(cookies_file):
-        ydl_opts["cookiefile"] = cookies_file
-        print(f"Using cookies file: {cookies_file}")
-    else:
-        print("No cookies file found, proceeding without authentication")
+    video_url = f"https://www.youtube.com/watch?v={video_id}"
+
+    # Most videos can be served by a timedtext or InnerTube lookup; the full
+    # yt-dlp extraction is the fallback
+    for fast_path in (_fetch_transcript_fast, _fetch_transcript_innertube):
+        fast_result = fast_path(video_id, video_url)
+        if fast_result is not None:
+            return fast_result
 
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False)
-
-            video_url = f"https://www.youtube.com/watch?v={video_id}"
-            video_name = info.get("title", "Unknown Title")
-
-            subtitles = info.get("subtitles", {})
-            auto_subs = info.get("automatic_captions", {})
-
-            # Check for English captions in both manual subtitles and auto-captions
-            caption_tracks = None
-            
-            if "en" in subtitles:
-                caption_tracks = subtitles["en"]
-                caption_type = "manual"
-            elif "en" in auto_subs:
-                caption_tracks = auto_subs["en"]
-                caption_type = "auto"
-            else:
-                return {
-                    "video_url": video_url,
-                    "video_name": video_name,
-                    "transcript": "",
-                    "success": False,
-                    "message": "No English captions available for this video"
-                }
-
-            if not caption_tracks:
-                return {
-                    "video_url": video_url,
-                    "video_name": video_name,
-                    "transcript": "",
-                    "success": False,
-                    "message": "No caption tracks found"
-                }
-
-            # Pick json3/srv3 first, fallback to VTT
-            chosen = next((c for c in caption_tracks if c.get("ext") in ("json3", "srv3")), caption_tracks[0])
-
-            resp = requests.get(chosen["url"])
-            if resp.status_code != 200:
-                return {
-                    "video_url": video_url,
-                    "video_name": video_name,
-                    "transcript": "",
-                    "success": False,
-                    "message": f"Failed to download captions (HTTP {resp.status_code})"
-                }
-
-            # Parse JSON captions
-            if chosen.get("ext") in ("json3", "srv3"):
-                try:
-                    data = resp.json()
-                except Exception:
-                    data = None
+        info = _extract_info(video_id)
 
-                if not data:
-                    return {
-                        "video_url": video_url,
-                        "video_name": video_name,
-                        "transcript": "",
-                        "success": False,
-                        "message": "Failed to parse JSON captions"
-                    }
-
-                texts = []
-                for event in data.get("events", []):
-                    for seg in event.get("segs", []):
-                        text_piece = seg.get("utf8", "").replace("\n", " ").strip()
-                        if text_piece:
-                            texts.append(text_piece)
-
-                transcript = " ".join(texts).strip()
-                return {
-                    "video_url": video_url,
-                    "video_name": video_name,
-                    "transcript": transcript,
-                    "success": True,
-                    "message": f"Transcript extracted successfully ({caption_type} captions)"
-                }
-
-            # Parse VTT/TTML fallback
-            clean_lines = [
-                re.sub(r"<[^>]+>", "", line.strip()).replace("&nbsp;", " ")
-                for line in resp.text.splitlines()
-                if line.strip() and "-->" not in line and not line.strip().isdigit()
-            ]
-
-            transcript = " ".join(clean_lines).strip()
-            return {
-                "video_url": video_url,
-                "video_name": video_name,
-                "transcript": transcript,
-                "success": True,
-                "message": f"Transcript extracted successfully ({caption_type} text captions)"
-            }
+        video_name = info.get("title", "Unknown Title")
 
-    except Exception as e:
+        caption_type, ext, status_code, body = _download_english_captions(info)
+        if caption_type is None:
+            return _transcript_result(
+                video_url, video_name, "", False,
+                "No English captions available for this video"
+            )
+        if ext is None:
+            return _transcript_result(video_url, video_name, "", False, "No caption tracks found")
+
+        if status_code == 429:
+            raise _rate_limited_error()
+        if status_code != 200:
+            return _transcript_result(
+                video_url, video_name, "", False,
+                f"Failed to download captions (HTTP {status_code})"
+            )
+
+        # Parse JSON captions
+        if ext == "json3":
+            transcript = _json3_body_to_transcript(body)
+            if transcript is None:
+                return _transcript_result(video_url, video_name, "", False, "Failed to parse JSON captions")
+
+            return _transcript_result(
+                video_url, video_name, transcript, True,
+                f"Transcript extracted successfully ({caption_type} captions)"
+            )
+
+        # Parse VTT/TTML fallback: drop the header, timing and cue-number lines, then strip
+        # tags and entities over the whole body instead of line by line
+        text = body.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+        text = _CUE_LINE_RE.sub("", text)
+        transcript = " ".join(html.unescape(_TAG_RE.sub("", text)).split())
+        return _transcript_result(
+            video_url, video_name, transcript, True,
+            f"Transcript extracted successfully ({caption_type} text captions)"
+        )
+
+    except HTTPException:
+        # The 429 raised for a throttled caption download above
+        raise
+
+    except DownloadError as e:
+        if _is_rate_limited(e):
+            raise _rate_limited_error() from e
         error_msg = str(e)
-        
+
         # Check if it's an authentication error
         if "Sign in to confirm you're not a bot" in error_msg:
-            return {
-                "video_url": f"https://www.youtube.com/watch?v={video_id}",
-                "video_name": "Authentication Required",
-                "transcript": "",
-                "success": False,
-                "message": "YouTube requires authentication. Please update your cookies.txt file with fresh cookies from your browser."
-            }
+            return _transcript_result(
+                video_url, "Authentication Required", "", False,
+                "YouTube requires authentication. Please update your cookies.txt file with fresh cookies from your browser."
+            )
         elif "cookies" in error_msg.lower():
-            return {
-                "video_url": f"https://www.youtube.com/watch?v={video_id}",
-                "video_name": "Cookie Error",
-                "transcript": "",
-                "success": False,
-                "message": "Cookie authentication failed. Please check your cookies.txt file format and ensure cookies are not expired."
-            }
+            return _transcript_result(
+                video_url, "Cookie Error", "", False,
+                "Cookie authentication failed. Please check your cookies.txt file format and ensure cookies are not expired."
+            )
         elif "Requested format is not available" in error_msg:
             # Try a simpler approach - just get video info without transcript
             try:
-                simple_opts = {
-                    "skip_download": True,
-                    "quiet": True,
-                    "no_warnings": True,
-                    "http_headers": ydl_opts["http_headers"]
-                }
-                
-                if os.path.exists(cookies_file):
-                    simple_opts["cookiefile"] = cookies_file
-                
-                with yt_dlp.YoutubeDL(simple_opts) as ydl:
-                    info = ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False)
+                with yt_dlp.YoutubeDL(_SIMPLE_YDL_OPTS) as ydl:
+                    info = ydl.extract_info(video_url, download=False)
                     
-                    return {
-                        "video_url": f"https://www.youtube.com/watch?v={video_id}",
-                        "video_name": info.get("title", "Unknown Title"),
-                        "transcript": "",
-                        "success": False,
-                        "message": "Video info extracted but no transcript available. This video might not have captions or they might be restricted."
-                    }
+                    return _transcript_result(
+                        video_url, info.get("title", "Unknown Title"), "", False,
+                        "Video info extracted but no transcript available. This video might not have captions or they might be restricted."
+                    )
             except Exception as fallback_error:
-                return {
-                    "video_url": f"https://www.youtube.com/watch?v={video_id}",
-                    "video_name": "Format Error",
-                    "transcript": "",
-                    "success": False,
-                    "message": f"Video format issue. This might be a restricted or unavailable video. Try a different video ID. Error: {str(fallback_error)}"
-                }
+                return _transcript_result(
+                    video_url, "Format Error", "", False,
+                    f"Video format issue. This might be a restricted or unavailable video. Try a different video ID. Error: {str(fallback_error)}"
+                )
         else:
-            return {
-                "video_url": f"https://www.youtube.com/watch?v={video_id}",
-                "video_name": "Error",
-                "transcript": "",
-                "success": False,
-                "message": f"Exception: {error_msg}"
-            }
+            return _transcript_result(video_url, "Error", "", False, f"Exception: {error_msg}")
+
+    except Exception as e:
+        return _transcript_result(video_url, "Error", "", False, f"Exception: {str(e)}")
+
+
+async def _run_singleflight(video_id: str, func):
+    """Run func(video_id) on the extraction executor, coalescing concurrent callers.
+
+    The event loop is single-threaded, so the lookup-then-insert on _INFLIGHT
+    needs no lock. The task is shielded so one client disconnecting does not
+    cancel the work for everyone else waiting on it.
+    """
+    key = (func, video_id)
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_run_extraction(func, video_id))
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    return dict(await asyncio.shield(task))
 
 
 @app.get("/")
@@ -351,7 +821,9 @@ async def root():
         "message": "YouTube Transcript API is running 🚀",
         "endpoints": {
             "/transcript/{video_id}": "Get transcript for a YouTube video",
+            "/transcript/{video_id}/stream": "Get transcript as a streamed JSON response",
             "/video-info/{video_id}": "Get video information without requiring captions",
+            "/bundle/{video_id}": "Get video information and transcript in one call",
             "/health": "Health check",
             "/auth-status": "Check cookie authentication status",
             "/test-youtube": "Test YouTube connectivity with current cookies"
@@ -361,11 +833,63 @@ async def root():
     }
 
 
-@app.get("/transcript/{video_id}", response_model=VideoResponse)
-async def transcript(video_id: str):
-    if not video_id or len(video_id) != 11:
-        raise HTTPException(status_code=400, detail="Invalid video ID (must be 11 characters)")
-    return VideoResponse(**get_video_info_and_transcript(video_id))
+# Successful transcripts rarely change, so browsers and proxies may reuse them
+_TRANSCRIPT_CACHE_CONTROL = "public, max-age=86400"
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header value lists etag (or is *)"""
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+@app.get("/transcript/{video_id}", response_model=VideoResponse, response_class=ORJSONResponse)
+async def transcript(video_id: str, request: Request):
+    if not _VIDEO_ID_RE.fullmatch(video_id):
+        raise HTTPException(status_code=400, detail="Invalid video ID (must be 11 letters, digits, - or _)")
+    # Extraction is blocking network I/O; keep it off the event loop
+    result = await _run_singleflight(video_id, get_video_info_and_transcript)
+    # The result dict is built by our own code with exactly the VideoResponse
+    # fields, so encode it directly and skip re-validating it on the way out.
+    # response_model is kept for the OpenAPI schema.
+    response = ORJSONResponse(result)
+    if not result["success"]:
+        # Failures can clear up after a cookie refresh; never let them be cached
+        return response
+
+    # The ETag is a hash of the encoded body, so it changes only if the transcript does
+    etag = '"' + hashlib.blake2b(response.body, digest_size=8).hexdigest() + '"'
+    headers = {"ETag": etag, "Cache-Control": _TRANSCRIPT_CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return response
+
+
+def _iter_transcript_json(result: dict, chunk_size: int = 65536):
+    """Yield a transcript result as JSON bytes, emitting the transcript in slices.
+
+    The metadata fields are encoded up front, then the transcript string is
+    escaped chunk by chunk so the full JSON document is never held in memory.
+    """
+    head = {key: value for key, value in result.items() if key != "transcript"}
+    yield orjson.dumps(head)[:-1] + b',"transcript":"'
+    transcript = result["transcript"]
+    for start in range(0, len(transcript), chunk_size):
+        # orjson.dumps of a str is a quoted JSON string; drop the quotes
+        yield orjson.dumps(transcript[start:start + chunk_size])[1:-1]
+    yield b'"}'
+
+
+@app.get("/transcript/{video_id}/stream")
+async def transcript_stream(video_id: str):
+    """Same payload as /transcript, streamed as chunked JSON"""
+    if not _VIDEO_ID_RE.fullmatch(video_id):
+        raise HTTPException(status_code=400, detail="Invalid video ID (must be 11 letters, digits, - or _)")
+    result = await _run_singleflight(video_id, get_video_info_and_transcript)
+    return StreamingResponse(_iter_transcript_json(result), media_type="application/json")
 
 
 @app.get("/health")
@@ -373,51 +897,70 @@ async def health_check():
     return {"status": "ok", "message": "Healthy"}
 
 
+def _read_cookie_expiries(cookies_file: str):
+    """Parse cookies.txt into (cookie_count, sorted positive expiry timestamps).
+
+    The parse is reused until the file's mtime or size changes, so repeated
+    /auth-status polls do not re-read the file.
+    """
+    st = os.stat(cookies_file)
+    key = (cookies_file, st.st_mtime_ns, st.st_size)
+    # Key and value live in one tuple, swapped in by a single assignment, so
+    # concurrent to_thread callers never pair a new key with an old value
+    entry = _COOKIE_STATS_CACHE.get("entry")
+    if entry is not None and entry[0] == key:
+        return entry[1]
+
+    # One pass over the raw bytes; the expiry field is ASCII digits
+    cookie_count = 0
+    expiries = []
+    with open(cookies_file, "rb") as f:
+        for line in f:
+            if line.startswith(b"#") or not line.strip():
+                continue
+            cookie_count += 1
+            parts = line.split(b"\t", 5)
+            if len(parts) >= 5 and parts[4].isdigit():
+                expiry = int(parts[4])
+                if expiry > 0:
+                    expiries.append(expiry)
+
+    expiries.sort()
+    _COOKIE_STATS_CACHE["entry"] = (key, (cookie_count, expiries))
+    return cookie_count, expiries
+
+
 @app.get("/auth-status")
 async def auth_status():
     """Check authentication status and provide guidance"""
-    cookies_file = "D:\Caption_n8n\YouTube-Transcript-Extractor-API\cookies.txt"
-    if os.path.exists(cookies_file):
-        try:
-            with open(cookies_file, 'r') as f:
-                content = f.read()
-                lines = content.strip().split('\n')
-                cookie_count = len([line for line in lines if line.strip() and not line.startswith('#')])
-                
-                # Check if cookies are expired (basic check)
-                expired_count = 0
-                current_time = int(time.time())
-                for line in lines:
-                    if line.strip() and not line.startswith('#'):
-                        parts = line.split('\t')
-                        if len(parts) >= 5:
-                            try:
-                                expiry = int(parts[4])
-                                if expiry > 0 and expiry < current_time:
-                                    expired_count += 1
-                            except ValueError:
-                                pass
-                
-                return {
-                    "cookies_file_exists": True,
-                    "total_cookies": cookie_count,
-                    "expired_cookies": expired_count,
-                    "status": "expired" if expired_count > 0 else "valid",
-                    "message": f"Found {cookie_count} cookies, {expired_count} expired" if expired_count > 0 else f"Found {cookie_count} valid cookies"
-                }
-        except Exception as e:
-            return {
-                "cookies_file_exists": True,
-                "error": str(e),
-                "status": "error",
-                "message": "Error reading cookies file"
-            }
-    else:
+    try:
+        # stat() and, after a change, the re-parse are disk I/O; keep them off the loop
+        cookie_count, expiries = await asyncio.to_thread(_read_cookie_expiries, _COOKIES_FILE)
+    except FileNotFoundError:
         return {
             "cookies_file_exists": False,
             "status": "missing",
             "message": "No cookies.txt file found. Please create one with fresh YouTube cookies."
         }
+    except Exception as e:
+        return {
+            "cookies_file_exists": True,
+            "error": str(e),
+            "status": "error",
+            "message": "Error reading cookies file"
+        }
+
+    # Compare against the current time on every call, so cached stats
+    # still notice cookies that expired since the file was parsed
+    expired_count = bisect.bisect_left(expiries, int(time.time()))
+
+    return {
+        "cookies_file_exists": True,
+        "total_cookies": cookie_count,
+        "expired_cookies": expired_count,
+        "status": "expired" if expired_count > 0 else "valid",
+        "message": f"Found {cookie_count} cookies, {expired_count} expired" if expired_count > 0 else f"Found {cookie_count} valid cookies"
+    }
 
 
 @app.get("/test-youtube")
@@ -426,7 +969,7 @@ async def test_youtube():
     try:
         # Test with a simple video that should have captions
         test_video_id = "dQw4w9WgXcQ"  # Rick Roll - should have captions
-        result = get_video_info_and_transcript(test_video_id)
+        result = await _run_extraction(get_video_info_and_transcript, test_video_id)
         
         return {
             "test_video_id": test_video_id,
@@ -444,62 +987,49 @@ async def test_youtube():
         }
 
 
-@app.get("/video-info/{video_id}")
-async def get_video_info_only(video_id: str):
-    """Get video information without requiring captions"""
-    if not video_id or len(video_id) != 11:
-        raise HTTPException(status_code=400, detail="Invalid video ID (must be 11 characters)")
-    
+def get_video_info(video_id: str):
+    """Extract video metadata plus timestamped English captions"""
     try:
-        cookies_file = "cookies.txt"
-        ydl_opts = {
-            "skip_download": True,
-            "quiet": True,
-            "no_warnings": True,
-            "http_headers": {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "en-us,en;q=0.5",
-                "Accept-Encoding": "gzip,deflate",
-                "Accept-Charset": "ISO-8859-1,utf-8;q=0.7,*;q=0.7",
-                "DNT": "1",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-            }
-        }
-        
-        if os.path.exists(cookies_file):
-            ydl_opts["cookiefile"] = cookies_file
+        info = _extract_info(video_id)
+
+        # Check for captions
+        subtitles = info.get("subtitles", {})
+        auto_subs = info.get("automatic_captions", {})
         
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False)
-            
-            # Check for captions
-            subtitles = info.get("subtitles", {})
-            auto_subs = info.get("automatic_captions", {})
-            
-            has_english_captions = "en" in subtitles or "en" in auto_subs
-            caption_languages = list(set(list(subtitles.keys()) + list(auto_subs.keys())))
-            extracted = _extract_captions_with_timestamps(info)
-            
-            return {
-                "video_id": video_id,
-                "video_url": f"https://www.youtube.com/watch?v={video_id}",
-                "title": info.get("title", "Unknown"),
-                "duration": info.get("duration"),
-                "view_count": info.get("view_count"),
-                "uploader": info.get("uploader"),
-                "upload_date": info.get("upload_date"),
-                "description": info.get("description", "")[:500] + "..." if info.get("description") and len(info.get("description", "")) > 500 else info.get("description", ""),
-                "has_captions": has_english_captions,
-                "available_caption_languages": caption_languages,
-                "captions": extracted.get("captions", []),
-                "caption_type": extracted.get("caption_type"),
-                "success": True,
-                "message": "Video information extracted successfully"
-            }
-            
+        # One set union over the key views; sorted so the list is stable between calls
+        languages = subtitles.keys() | auto_subs.keys()
+        has_english_captions = "en" in languages
+        caption_languages = sorted(languages)
+        extracted = _extract_captions_with_timestamps(info)
+
+        description = info.get("description") or ""
+        if len(description) > 500:
+            description = description[:500] + "..."
+
+        return {
+            "video_id": video_id,
+            "video_url": f"https://www.youtube.com/watch?v={video_id}",
+            "title": info.get("title", "Unknown"),
+            "duration": info.get("duration"),
+            "view_count": info.get("view_count"),
+            "uploader": info.get("uploader"),
+            "upload_date": info.get("upload_date"),
+            "description": description,
+            "has_captions": has_english_captions,
+            "available_caption_languages": caption_languages,
+            "captions": extracted.get("captions", []),
+            "caption_type": extracted.get("caption_type"),
+            "success": True,
+            "message": "Video information extracted successfully"
+        }
+
+    except HTTPException:
+        # A throttled caption download; already a 429 for the client
+        raise
+
     except Exception as e:
+        if _is_rate_limited(e):
+            raise _rate_limited_error() from e
         return {
             "video_id": video_id,
             "video_url": f"https://www.youtube.com/watch?v={video_id}",
@@ -509,6 +1039,29 @@ async def get_video_info_only(video_id: str):
         }
 
 
+@app.get("/video-info/{video_id}")
+async def get_video_info_only(video_id: str):
+    """Get video information without requiring captions"""
+    if not _VIDEO_ID_RE.fullmatch(video_id):
+        raise HTTPException(status_code=400, detail="Invalid video ID (must be 11 letters, digits, - or _)")
+    # yt-dlp and the caption download block; run them off the event loop.
+    # Returning the response directly skips FastAPI's jsonable_encoder walk.
+    return ORJSONResponse(await _run_singleflight(video_id, get_video_info))
+
+
+@app.get("/bundle/{video_id}")
+async def get_video_bundle(video_id: str):
+    """Get /video-info and /transcript results for a video in one call"""
+    if not _VIDEO_ID_RE.fullmatch(video_id):
+        raise HTTPException(status_code=400, detail="Invalid video ID (must be 11 letters, digits, - or _)")
+    # Run both lookups concurrently; latency is the slower of the two
+    video_info, transcript_result = await asyncio.gather(
+        _run_singleflight(video_id, get_video_info),
+        _run_singleflight(video_id, get_video_info_and_transcript)
+    )
+    return ORJSONResponse({"video_info": video_info, "transcript": transcript_result})
+
+
 if __name__ == "__main__":
     import uvicorn
     import os
@@ -519,5 +1072,17 @@ if __name__ == "__main__":
     # Use 0.0.0.0 for Railway, localhost for local development
     host = "0.0.0.0" if os.environ.get("RAILWAY_ENVIRONMENT") else "127.0.0.1"
     
-    print(f"Starting server on {host}:{port}")
-    uvicorn.run("main:app", host=host, port=port, reload=False)
\ No newline at end of file
+    # uvloop and httptools come with uvicorn[standard]; uvloop has no Windows build
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+
+    # Caches and in-flight de-duplication are per process, so extra workers
+    # are opt-in via WEB_CONCURRENCY
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+
+    # Per-request access lines are formatted and written on the event loop;
+    # set ACCESS_LOG=1 to turn them back on
+    access_log = os.environ.get("ACCESS_LOG", "0") == "1"
+
+    print(f"Starting server on {host}:{port} ({workers} worker(s), {loop} loop)")
+    uvicorn.run("main:app", host=host, port=port, loop=loop, http="httptools", workers=workers,
+                reload=False, access_log=access_log)
\ No newline at end of file